@@ -297,6 +297,7 @@ from cirq.optimizers import (
     merge_single_qubit_gates_into_phxz,
     MergeInteractions,
     MergeSingleQubitGates,
+    single_qubit_matrices_to_phased_x_z,
     single_qubit_matrix_to_gates,
     single_qubit_matrix_to_pauli_rotations,
     single_qubit_matrix_to_phased_x_z,
@@ -39,13 +39,35 @@ MAGIC = np.array([[1, 0, 0, 1j],
 MAGIC_CONJ_T = np.conj(MAGIC.T)
 
 
-def _phase_matrix(angle: float) -> np.ndarray:
-    return np.diag([1, np.exp(1j * angle)])
+def _phase_ratio(x: complex, y: complex) -> float:
+    """Returns the phase of x * conj(y), without building the product."""
+    return math.atan2(x.imag * y.real - x.real * y.imag,
+                      x.real * y.real + x.imag * y.imag)
 
 
-def _rotation_matrix(angle: float) -> np.ndarray:
-    c, s = np.cos(angle), np.sin(angle)
-    return np.array([[c, -s], [s, c]])
+def _zyz_angles(a: complex, b: complex, c: complex,
+                d: complex) -> Tuple[float, float, float]:
+    """ZYZ angles of the 2x2 unitary [[a, b], [c, d]], from scalar entries."""
+    # Anti-cancel left-vs-right phase along top row.
+    right_phase = _phase_ratio(b, a) + math.pi
+    right = cmath.exp(-1j * right_phase)
+
+    # Cancel top-vs-bottom phase along left column.
+    bottom_phase = _phase_ratio(c, a)
+    bottom = cmath.exp(-1j * bottom_phase)
+
+    # Lined up for a rotation. Clearing the off-diagonal cells with one would
+    # leave these entries on the diagonal.
+    rotation = math.atan2(abs(c), abs(a))
+    cos, sin = math.cos(rotation), math.sin(rotation)
+    top_left = cos * a + sin * c * bottom
+    bottom_right = (cos * d * bottom - sin * b) * right
+
+    # Cancel top-left-vs-bottom-right phase.
+    diagonal_phase = _phase_ratio(bottom_right, top_left)
+
+    # Note: Ignoring global phase.
+    return right_phase + diagonal_phase, rotation * 2, bottom_phase
 
 
 def deconstruct_single_qubit_matrix_into_angles(
@@ -59,23 +81,8 @@ def deconstruct_single_qubit_matrix_into_angles(
         A tuple containing the amount to phase around Z, then rotate around Y,
         then phase around Z (all in radians).
     """
-    # Anti-cancel left-vs-right phase along top row.
-    right_phase = cmath.phase(mat[0, 1] * np.conj(mat[0, 0])) + math.pi
-    mat = np.dot(mat, _phase_matrix(-right_phase))
-
-    # Cancel top-vs-bottom phase along left column.
-    bottom_phase = cmath.phase(mat[1, 0] * np.conj(mat[0, 0]))
-    mat = np.dot(_phase_matrix(-bottom_phase), mat)
-
-    # Lined up for a rotation. Clear the off-diagonal cells with one.
-    rotation = math.atan2(abs(mat[1, 0]), abs(mat[0, 0]))
-    mat = np.dot(_rotation_matrix(-rotation), mat)
-
-    # Cancel top-left-vs-bottom-right phase.
-    diagonal_phase = cmath.phase(mat[1, 1] * np.conj(mat[0, 0]))
-
-    # Note: Ignoring global phase.
-    return right_phase + diagonal_phase, rotation * 2, bottom_phase
+    return _zyz_angles(complex(mat[0, 0]), complex(mat[0, 1]),
+                       complex(mat[1, 0]), complex(mat[1, 1]))
 
 
 def _group_similar(items: List[T],
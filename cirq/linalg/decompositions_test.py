@@ -20,6 +20,7 @@ import pytest
 import cirq
 from cirq import value
 from cirq import unitary_eig
+from cirq.linalg.decompositions import _phase_ratio
 
 X = np.array([[0, 1], [1, 0]])
 Y = np.array([[0, -1j], [1j, 0]])
@@ -124,6 +125,32 @@ def test_non_unitary_eig():
             np.array([[1, 2, 3, 4], [5, 6, 7, 8], [9, 0, 1, 2], [3, 4, 5, 6]]))
 
 
+@pytest.mark.parametrize('mat', [
+    np.eye(2),
+    H,
+    X,
+    Y,
+    Z,
+    SQRT_SQRT_X,
+    np.diag([1, 1j]),
+    np.diag([1j, 1]),
+] + [cirq.testing.random_unitary(2) for _ in range(10)])
+def test_deconstruct_single_qubit_matrix_into_angles(mat):
+    pre, rotation, post = (
+        cirq.linalg.deconstruct_single_qubit_matrix_into_angles(mat))
+    actual = (cirq.unitary(cirq.rz(post)) @ cirq.unitary(cirq.ry(rotation))
+              @ cirq.unitary(cirq.rz(pre)))
+    cirq.testing.assert_allclose_up_to_global_phase(actual, mat, atol=1e-8)
+
+
+@pytest.mark.parametrize('x,y', [(1, 1), (-1, 1), (1j, 1), (1, 1j),
+                                 (2 - 3j, -1 + 0.5j), (0, 1), (1e-20j, 1)])
+def test_phase_ratio(x, y):
+    assert np.isclose(_phase_ratio(complex(x), complex(y)),
+                      np.angle(x * np.conj(y)),
+                      atol=1e-12)
+
+
 @pytest.mark.parametrize('f1,f2', [
     (H, X),
     (H * 1j, X),
@@ -46,6 +46,7 @@ from cirq.optimizers.merge_single_qubit_gates import (
 
 from cirq.optimizers.decompositions import (
     is_negligible_turn,
+    single_qubit_matrices_to_phased_x_z,
     single_qubit_matrix_to_gates,
     single_qubit_matrix_to_pauli_rotations,
     single_qubit_matrix_to_phased_x_z,
@@ -34,7 +34,8 @@ def _is_identity(matrix):
 
 
 def _flatten(x):
-    return sum(x, [])
+    # Unlike sum(x, []), this doesn't copy the partial result for each list.
+    return [item for sublist in x for item in sublist]
 
 
 def _decompose_abc(matrix: np.ndarray
@@ -49,8 +50,10 @@ def _decompose_abc(matrix: np.ndarray
     """
     assert matrix.shape == (2, 2)
     delta = np.angle(np.linalg.det(matrix)) * 0.5
-    alpha = np.angle(matrix[0, 0]) + np.angle(matrix[0, 1]) - 2 * delta
-    beta = np.angle(matrix[0, 0]) - np.angle(matrix[0, 1])
+    phase_00 = np.angle(matrix[0, 0])
+    phase_01 = np.angle(matrix[0, 1])
+    alpha = phase_00 + phase_01 - 2 * delta
+    beta = phase_00 - phase_01
 
     m00_abs = np.abs(matrix[0, 0])
     if np.abs(m00_abs - 1.0) < 1e-9:
@@ -77,19 +80,37 @@ def _decompose_single_ctrl(matrix: np.ndarray, control: 'cirq.Qid',
     See [1], chapter 5.1.
     """
     a, b, c, delta = _decompose_abc(matrix)
+    return _abc_to_single_ctrl_ops(a, b, c, delta, control, target)
 
-    result = [
-        ops.ZPowGate(exponent=delta / np.pi).on(control),
-        ops.MatrixGate(c).on(target),
-        ops.CNOT.on(control, target),
-        ops.MatrixGate(b).on(target),
-        ops.CNOT.on(control, target),
-        ops.MatrixGate(a).on(target),
-    ]
 
-    # Remove no-ops.
-    result = [g for g in result if not _is_identity(unitary(g))]
+def _decompose_single_ctrl_inverse(
+        a: np.ndarray, b: np.ndarray, c: np.ndarray, delta: float,
+        control: 'cirq.Qid', target: 'cirq.Qid') -> List['cirq.Operation']:
+    """Decomposes the controlled inverse of an already decomposed gate.
 
+    If A, B, C and delta decompose M, then C^-1, B^-1, A^-1 and -delta
+    decompose M^-1, so there is no need to run `_decompose_abc` again.
+    """
+    return _abc_to_single_ctrl_ops(np.conj(c.T), np.conj(b.T), np.conj(a.T),
+                                   -delta, control, target)
+
+
+def _abc_to_single_ctrl_ops(a: np.ndarray, b: np.ndarray, c: np.ndarray,
+                            delta: float, control: 'cirq.Qid',
+                            target: 'cirq.Qid') -> List['cirq.Operation']:
+    # No-ops are left out. They are detected from the phase and matrices
+    # directly, instead of building each gate and computing its unitary.
+    result = []  # type: List[cirq.Operation]
+    if not np.isclose(np.exp(1j * delta), 1):
+        result.append(ops.ZPowGate(exponent=delta / np.pi).on(control))
+    if not _is_identity(c):
+        result.append(ops.MatrixGate(c).on(target))
+    result.append(ops.CNOT.on(control, target))
+    if not _is_identity(b):
+        result.append(ops.MatrixGate(b).on(target))
+    result.append(ops.CNOT.on(control, target))
+    if not _is_identity(a):
+        result.append(ops.MatrixGate(a).on(target))
     return result
 
 
@@ -201,11 +222,12 @@ def _decompose_recursive(matrix: np.ndarray, power: float,
 
     cnots = decompose_multi_controlled_x(controls[:-1], controls[-1],
                                          free_qubits + [target])
+    a, b, c, delta = _decompose_abc(_unitary_power(matrix, 0.5 * power))
     return [
-        *_decompose_single_ctrl(_unitary_power(matrix, 0.5 * power),
-                                controls[-1], target), *cnots,
-        *_decompose_single_ctrl(_unitary_power(matrix, -0.5 * power),
-                                controls[-1], target), *cnots,
+        *_abc_to_single_ctrl_ops(a, b, c, delta, controls[-1], target),
+        *cnots,
+        *_decompose_single_ctrl_inverse(a, b, c, delta, controls[-1], target),
+        *cnots,
         *_decompose_recursive(matrix, 0.5 * power, controls[:-1], target,
                               [controls[-1]] + free_qubits)
     ]
@@ -139,3 +139,14 @@ def test_decompose_size_unitary():
     assert _decomposition_size(u, 7) == (340, 244, 38)
     assert _decomposition_size(u, 8) == (524, 380, 46)
     assert _decomposition_size(u, 9) == (820, 600, 58)
+
+
+def test_decompose_size_pauli():
+    # The controlled inverse reuses the ABC decomposition of the controlled
+    # square root, so both have the same number of single-qubit gates.
+    y = cirq.unitary(cirq.Y)
+    for u in [cirq.unitary(cirq.X), y, -y, cirq.unitary(cirq.Z)]:
+        assert _decomposition_size(u, 2) == (12, 8, 0)
+        assert _decomposition_size(u, 3) == (20, 12, 2)
+    assert _decomposition_size(cirq.unitary(cirq.Y**-0.5), 2) == (9, 8, 0)
+    assert _decomposition_size(cirq.unitary(cirq.Y**-0.5), 3) == (15, 12, 2)
@@ -14,8 +14,9 @@
 
 """Utility methods related to optimizing quantum circuits."""
 
+import cmath
 import math
-from typing import List, Optional, Tuple, cast
+from typing import Iterable, List, Optional, Tuple, cast
 
 import numpy as np
 import sympy
@@ -23,6 +24,9 @@ import sympy
 from cirq import ops, linalg, protocols
 from cirq.linalg.tolerance import near_zero_mod
 
+# Radians to whole turns, precomputed for the per-gate angle conversions.
+_TURNS_PER_RADIAN = 1 / (2 * math.pi)
+
 
 def is_negligible_turn(turns: float, tolerance: float) -> bool:
     if isinstance(turns, sympy.Basic):
@@ -33,7 +37,16 @@ def is_negligible_turn(turns: float, tolerance: float) -> bool:
 
 
 def _signed_mod_1(x: float) -> float:
-    return (x + 0.5) % 1 - 0.5
+    # Exact, since x and its nearest integer are close. Like np.round in
+    # `_signed_mod_1_array`, round() rounds half to even.
+    r = x - round(x)
+    return -0.5 if r == 0.5 else r
+
+
+def _signed_mod_1_array(x: np.ndarray) -> np.ndarray:
+    # Elementwise `_signed_mod_1`; np.round also rounds half to even.
+    r = x - np.round(x)
+    return np.where(r == 0.5, -0.5, r)
 
 
 def single_qubit_matrix_to_pauli_rotations(
@@ -139,10 +152,40 @@ def single_qubit_op_to_framed_phase_form(
         When M is controlled, the control must be rotated around the Z axis to
         apply g.
     """
-    vals, vecs = np.linalg.eig(mat)
-    u = np.conj(vecs).T
-    r = vals[1] / vals[0]
-    g = vals[0]
+    a, b = complex(mat[0, 0]), complex(mat[0, 1])
+    c, d = complex(mat[1, 0]), complex(mat[1, 1])
+
+    # Closed-form eigenvalues. The discriminant is written as
+    # ((a-d)/2)^2 + bc instead of (tr/2)^2 - det to avoid cancellation when
+    # the eigenvalues are close together.
+    half_trace = (a + d) / 2
+    half_gap = cmath.sqrt(((a - d) / 2)**2 + b * c)
+    g = half_trace + half_gap
+    r = (half_trace - half_gap) / g
+
+    # Eigenvector of g, taken from the better conditioned row of (M - g).
+    x, y = b, g - a
+    if abs(x)**2 + abs(y)**2 < abs(g - d)**2 + abs(c)**2:
+        x, y = g - d, c
+    norm = math.hypot(abs(x), abs(y))
+    if norm == 0:
+        # M is a multiple of the identity; any basis works.
+        x, y, norm = 1, 0, 1
+    # Fix the free phase of the eigenvector by making its first entry real,
+    # which makes U special unitary.
+    if x:
+        y *= x.conjugate() / abs(x)
+        x = abs(x)
+    x /= norm
+    y /= norm
+
+    # Rows of U are the conjugated eigenvectors; the second one is orthogonal
+    # to the first.
+    u = np.empty((2, 2), dtype=np.complex128)
+    u[0, 0] = x.conjugate()
+    u[0, 1] = y.conjugate()
+    u[1, 0] = -y
+    u[1, 1] = x
     return u, r, g
 
 
@@ -161,18 +204,55 @@ def _deconstruct_single_qubit_matrix_into_gate_turns(
     """
     pre_phase, rotation, post_phase = (
         linalg.deconstruct_single_qubit_matrix_into_angles(mat))
-
-    # Figure out parameters of the actual gates we will do.
-    tau = 2 * np.pi
-    xy_turn = rotation / tau
-    xy_phase_turn = 0.25 - pre_phase / tau
-    total_z_turn = (post_phase + pre_phase) / tau
+    xy_turn, xy_phase_turn, total_z_turn = _angles_to_gate_turns(
+        pre_phase, rotation, post_phase)
 
     # Normalize turns into the range [-0.5, 0.5).
     return (_signed_mod_1(xy_turn), _signed_mod_1(xy_phase_turn),
             _signed_mod_1(total_z_turn))
 
 
+def _deconstruct_single_qubit_matrices_into_gate_turns(
+        mats: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized `_deconstruct_single_qubit_matrix_into_gate_turns`.
+
+    Args:
+        mats: The 2x2 unitary matrices to break down, stacked along the first
+            axis.
+
+    Returns:
+        Three arrays holding, for each matrix, the same values as
+        `_deconstruct_single_qubit_matrix_into_gate_turns`.
+    """
+    assert mats.ndim == 3 and mats.shape[1:] == (2, 2)
+    a, b = mats[:, 0, 0], mats[:, 0, 1]
+    c, d = mats[:, 1, 0], mats[:, 1, 1]
+
+    # Same steps as linalg.deconstruct_single_qubit_matrix_into_angles.
+    right_phase = np.angle(b * np.conj(a)) + np.pi
+    bottom_phase = np.angle(c * np.conj(a))
+    rotation = np.arctan2(np.abs(c), np.abs(a))
+    cos, sin = np.cos(rotation), np.sin(rotation)
+    bottom = np.exp(-1j * bottom_phase)
+    top_left = cos * a + sin * c * bottom
+    bottom_right = (cos * d * bottom - sin * b) * np.exp(-1j * right_phase)
+    diagonal_phase = np.angle(bottom_right * np.conj(top_left))
+
+    xy_turns, xy_phase_turns, total_z_turns = _angles_to_gate_turns(
+        right_phase + diagonal_phase, rotation * 2, bottom_phase)
+    return (_signed_mod_1_array(xy_turns), _signed_mod_1_array(xy_phase_turns),
+            _signed_mod_1_array(total_z_turns))
+
+
+def _angles_to_gate_turns(pre_phase, rotation, post_phase):
+    """Converts ZYZ angles (scalars or arrays) into XY and Z gate turns."""
+    # Figure out parameters of the actual gates we will do.
+    xy_turn = rotation * _TURNS_PER_RADIAN
+    xy_phase_turn = 0.25 - pre_phase * _TURNS_PER_RADIAN
+    total_z_turn = (post_phase + pre_phase) * _TURNS_PER_RADIAN
+    return xy_turn, xy_phase_turn, total_z_turn
+
+
 def single_qubit_matrix_to_phased_x_z(
         mat: np.ndarray,
         atol: float = 0
@@ -191,14 +271,87 @@ def single_qubit_matrix_to_phased_x_z(
             operation.
     """
 
+    # Shortcut: (nearly) diagonal matrices need at most a Z gate.
+    if abs(mat[0, 1]) <= atol and abs(mat[1, 0]) <= atol:
+        return _diagonal_to_z(mat[0, 0], mat[1, 1], atol)
+
     xy_turn, xy_phase_turn, total_z_turn = (
         _deconstruct_single_qubit_matrix_into_gate_turns(mat))
+    return _turns_to_phased_x_z(xy_turn, xy_phase_turn, total_z_turn, atol)
+
+
+def single_qubit_matrices_to_phased_x_z(
+        mats: Iterable[np.ndarray],
+        atol: float = 0) -> List[List[ops.SingleQubitGate]]:
+    """Implements several single-qubit operations with PhasedX and Z gates.
+
+    Gives the same gates as calling `single_qubit_matrix_to_phased_x_z` on each
+    matrix, but computes the decomposition angles for all of them at once.
+
+    Args:
+        mats: The 2x2 unitary matrices of the operations to implement, either
+            as a sequence or stacked into an array of shape (N, 2, 2).
+        atol: A limit on the amount of error introduced by the
+            construction.
+
+    Returns:
+        A list with, for each matrix, the list of gates that, when applied in
+            order, perform the corresponding operation.
+
+    Raises:
+        ValueError: The matrices aren't 2x2.
+    """
+    if not isinstance(mats, np.ndarray):
+        mats = list(mats)
+    mats = np.asarray(mats, dtype=np.complex128)
+    if mats.size == 0:
+        return []
+    if mats.ndim != 3 or mats.shape[1:] != (2, 2):
+        raise ValueError('Expected matrices with shape (N, 2, 2), but got '
+                         f'{mats.shape}.')
+    is_diagonal = np.logical_and(
+        np.abs(mats[:, 0, 1]) <= atol,
+        np.abs(mats[:, 1, 0]) <= atol).tolist()
+    xy_turns, xy_phase_turns, total_z_turns = (
+        _deconstruct_single_qubit_matrices_into_gate_turns(mats))
+    return [
+        _diagonal_to_z(mat[0, 0], mat[1, 1], atol) if diagonal else
+        _turns_to_phased_x_z(xy_turn, xy_phase_turn, total_z_turn, atol)
+        for mat, diagonal, xy_turn, xy_phase_turn, total_z_turn in zip(
+            mats, is_diagonal, xy_turns.tolist(), xy_phase_turns.tolist(),
+            total_z_turns.tolist())
+    ]
+
+
+def _phase_ratio(x: complex, y: complex) -> float:
+    """Returns the phase of x * conj(y), without building the product."""
+    return math.atan2(x.imag * y.real - x.real * y.imag,
+                      x.real * y.real + x.imag * y.imag)
+
+
+def _diagonal_to_z(top_left: complex, bottom_right: complex,
+                   atol: float) -> List[ops.SingleQubitGate]:
+    """Implements diag(top_left, bottom_right) with at most one Z gate."""
+    z_turn = _signed_mod_1(
+        _phase_ratio(bottom_right, top_left) * _TURNS_PER_RADIAN)
+    if atol == 0:
+        return [ops.ZPowGate(exponent=2 * z_turn)] if z_turn else []
+    g = ops.ZPowGate(exponent=2 * z_turn)
+    return [g] if protocols.trace_distance_bound(g) > atol else []
+
+
+def _turns_to_phased_x_z(xy_turn: float, xy_phase_turn: float,
+                         total_z_turn: float,
+                         atol: float) -> List[ops.SingleQubitGate]:
+    if atol == 0:
+        return _turns_to_phased_x_z_exact(xy_turn, xy_phase_turn,
+                                          total_z_turn)
 
     # Build the intended operation out of non-negligible XY and Z rotations.
     result = [
         ops.PhasedXPowGate(exponent=2 * xy_turn,
                            phase_exponent=2 * xy_phase_turn),
-        ops.Z**(2 * total_z_turn)
+        ops.ZPowGate(exponent=2 * total_z_turn)
     ]
     result = [
         g for g in result
@@ -214,6 +367,39 @@ def single_qubit_matrix_to_phased_x_z(
     return result
 
 
+def _turns_to_phased_x_z_exact(xy_turn: float, xy_phase_turn: float,
+                               total_z_turn: float
+                              ) -> List[ops.SingleQubitGate]:
+    """Same as `_turns_to_phased_x_z` with atol=0.
+
+    The turns are canonicalized into [-0.5, 0.5), so a gate's trace distance
+    bound is zero exactly when its turn is zero. That is checked directly
+    instead of constructing the gate and computing its bound.
+    """
+    if not xy_turn:
+        if not total_z_turn:
+            return []
+        return [ops.ZPowGate(exponent=2 * total_z_turn)]
+    if not total_z_turn:
+        return [
+            ops.PhasedXPowGate(exponent=2 * xy_turn,
+                               phase_exponent=2 * xy_phase_turn)
+        ]
+
+    # Special case: XY half-turns can absorb Z rotations. Matches the general
+    # path's check, whose relative tolerance still applies when atol is 0.
+    if math.isclose(abs(xy_turn), 0.5):
+        return [
+            ops.PhasedXPowGate(phase_exponent=2 * xy_phase_turn + total_z_turn)
+        ]
+
+    return [
+        ops.PhasedXPowGate(exponent=2 * xy_turn,
+                           phase_exponent=2 * xy_phase_turn),
+        ops.ZPowGate(exponent=2 * total_z_turn)
+    ]
+
+
 def single_qubit_matrix_to_phxz(
         mat: np.ndarray,
         atol: float = 0,
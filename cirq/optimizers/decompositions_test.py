@@ -22,6 +22,10 @@ import pytest
 import sympy
 
 import cirq
+from cirq.optimizers.decompositions import (_signed_mod_1,
+                                           _signed_mod_1_array,
+                                           _turns_to_phased_x_z,
+                                           _turns_to_phased_x_z_exact)
 
 
 def assert_gates_implement_unitary(gates: Sequence[cirq.SingleQubitGate],
@@ -59,6 +63,44 @@ def test_is_negligible_turn():
     assert not cirq.is_negligible_turn(sympy.Symbol('a') * 0 + 1.5 - 1e-6, 1e-5)
 
 
+@pytest.mark.parametrize('x,expected', [
+    (0, 0),
+    (0.25, 0.25),
+    (0.5, -0.5),
+    (-0.5, -0.5),
+    (0.75, -0.25),
+    (2.5, -0.5),
+    (-3.25, -0.25),
+    # Exact even when adding 0.5 would round away low bits.
+    (2**30 - 2**-23, -2**-23),
+])
+def test_signed_mod_1(x, expected):
+    assert _signed_mod_1(x) == expected
+    assert _signed_mod_1_array(np.array([x])).tolist() == [expected]
+
+
+@pytest.mark.parametrize('xy_turn',
+                         [0, 0.25, -0.1, -0.5, -0.5 + 5e-11, 0.5 - 5e-11])
+@pytest.mark.parametrize('xy_phase_turn', [0, 0.3])
+@pytest.mark.parametrize('total_z_turn', [0, -0.25, 0.4, -0.5])
+def test_turns_to_phased_x_z_exact(xy_turn, xy_phase_turn, total_z_turn):
+    # A tiny nonzero tolerance takes the general path with the same result.
+    general = _turns_to_phased_x_z(xy_turn, xy_phase_turn, total_z_turn,
+                                   1e-300)
+    assert _turns_to_phased_x_z_exact(xy_turn, xy_phase_turn,
+                                      total_z_turn) == general
+
+
+@pytest.mark.parametrize('p', np.linspace(-1, 1, 9))
+def test_single_qubit_matrix_to_phased_x_z_near_half_turn(p):
+    # Float noise around an XY half turn still absorbs the Z rotation.
+    mat = cirq.unitary(cirq.Z**0.3) @ cirq.unitary(
+        cirq.PhasedXPowGate(exponent=1 - 1e-10, phase_exponent=p))
+    gates = cirq.single_qubit_matrix_to_phased_x_z(mat)
+    assert len(gates) == 1
+    assert_gates_implement_unitary(gates, mat, atol=1e-8)
+
+
 def test_single_qubit_matrix_to_gates_known_x():
     actual = cirq.single_qubit_matrix_to_gates(
         np.array([[0, 1], [1, 0]]), tolerance=0.01)
@@ -195,6 +237,9 @@ def test_single_qubit_op_to_framed_phase_form_output_on_example_case():
     cirq.unitary(cirq.Y),
     cirq.unitary(cirq.Z),
     cirq.unitary(cirq.Z**0.5),
+    cirq.unitary(cirq.Z**1e-7),
+    cirq.unitary(cirq.X**1e-7),
+    1j * np.eye(2),
 ] + [cirq.testing.random_unitary(2)
      for _ in range(10)])
 def test_single_qubit_op_to_framed_phase_form_equivalent_on_known_and_random(
@@ -305,6 +350,57 @@ def test_single_qubit_matrix_to_phased_x_z_tolerance_half_turn_phasing():
     assert len(kept) == 2
 
 
+def test_single_qubit_matrix_to_phased_x_z_nearly_diagonal():
+    nearly_s = cirq.unitary(cirq.S).dot(cirq.unitary(cirq.X**0.0001))
+
+    gates = cirq.single_qubit_matrix_to_phased_x_z(nearly_s, atol=0.01)
+    assert len(gates) == 1
+    assert isinstance(gates[0], cirq.ZPowGate)
+    assert_gates_implement_unitary(gates, nearly_s, atol=0.01)
+    assert cirq.approx_eq(
+        cirq.single_qubit_matrices_to_phased_x_z([nearly_s], atol=0.01),
+        [gates])
+
+    assert cirq.single_qubit_matrix_to_phased_x_z(np.eye(2) * 1j) == []
+    assert len(cirq.single_qubit_matrix_to_phased_x_z(nearly_s)) == 2
+
+
+def test_single_qubit_matrices_to_phased_x_z_matches_single_version():
+    mats = [
+        np.array([[0, 1], [1, 0]]),
+        np.array([[0, 1j], [1, 0]]),
+        np.array([[1, 0], [0, 1j]]),
+        np.array([[1, 1], [1, -1]]) * np.sqrt(0.5),
+    ] + [cirq.testing.random_unitary(2) for _ in range(10)]
+
+    batched = cirq.single_qubit_matrices_to_phased_x_z(mats, atol=1e-6)
+    assert len(batched) == len(mats)
+    for gates, mat in zip(batched, mats):
+        expected = cirq.single_qubit_matrix_to_phased_x_z(mat, atol=1e-6)
+        assert [type(g) for g in gates] == [type(g) for g in expected]
+        for g, e in zip(gates, expected):
+            np.testing.assert_allclose(cirq.unitary(g),
+                                       cirq.unitary(e),
+                                       atol=1e-8)
+        assert_gates_implement_unitary(gates, mat, atol=1e-5)
+
+    stacked = cirq.single_qubit_matrices_to_phased_x_z(np.array(mats),
+                                                       atol=1e-6)
+    assert [len(gates) for gates in stacked] == [
+        len(gates) for gates in batched
+    ]
+    assert cirq.single_qubit_matrices_to_phased_x_z([]) == []
+
+
+def test_single_qubit_matrices_to_phased_x_z_bad_shape():
+    with pytest.raises(ValueError, match='shape'):
+        cirq.single_qubit_matrices_to_phased_x_z(np.eye(4))
+    with pytest.raises(ValueError, match='shape'):
+        cirq.single_qubit_matrices_to_phased_x_z(np.ones(8))
+    with pytest.raises(ValueError, match='shape'):
+        cirq.single_qubit_matrices_to_phased_x_z(np.zeros((3, 2, 3)))
+
+
 @pytest.mark.parametrize('intended_effect', [
     np.array([[0, 1], [1, 0]]),
     np.array([[0, -1j], [1j, 0]]),
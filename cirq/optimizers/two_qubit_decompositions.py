@@ -14,7 +14,8 @@
 
 """Utility methods related to optimizing quantum circuits."""
 
-from typing import Iterable, List, Tuple, Optional, cast, TYPE_CHECKING
+import collections
+from typing import Dict, List, Tuple, Optional, cast, TYPE_CHECKING
 
 import numpy as np
 
@@ -29,6 +30,10 @@ from cirq.optimizers import (
 if TYPE_CHECKING:
     import cirq
 
+# Interaction angles in radians to the exponents of the gates implementing
+# them, precomputed for the per-interaction conversions.
+_EXPONENT_PER_RADIAN = -2 / np.pi
+
 
 def two_qubit_matrix_to_operations(
         q0: 'cirq.Qid',
@@ -53,6 +58,50 @@ def two_qubit_matrix_to_operations(
     Returns:
         A list of operations implementing the matrix.
     """
+    if not isinstance(mat, np.ndarray) or mat.shape != (4, 4):
+        return _two_qubit_matrix_to_operations(q0, q1, mat, allow_partial_czs,
+                                               atol, clean_operations)
+
+    # Circuits tend to repeat the same two-qubit unitaries, so decompositions
+    # are cached on placeholder qubits and then moved onto the actual ones.
+    # The rounded matrix is only the cache key; misses decompose `mat` itself.
+    key = (np.round(mat.astype(np.complex128), _CACHE_DECIMALS).tobytes(),
+           allow_partial_czs, atol, clean_operations)
+    template = _TEMPLATE_CACHE.get(key)
+    if template is None:
+        template = tuple(
+            _two_qubit_matrix_to_operations(*_TEMPLATE_QUBITS, mat,
+                                            allow_partial_czs, atol,
+                                            clean_operations))
+        if len(_TEMPLATE_CACHE) >= _CACHE_SIZE:
+            _TEMPLATE_CACHE.popitem(last=False)
+        _TEMPLATE_CACHE[key] = template
+    else:
+        _TEMPLATE_CACHE.move_to_end(key)
+    return _template_operations_on(template, q0, q1)
+
+
+# Matrices are rounded to this many decimals before being used as cache keys.
+_CACHE_DECIMALS = 12
+_CACHE_SIZE = 4096
+_TEMPLATE_QUBITS = (ops.NamedQubit('_q0'), ops.NamedQubit('_q1'))
+_TemplateKey = Tuple[bytes, bool, float, bool]
+# Decompositions on `_TEMPLATE_QUBITS`, least recently used first.
+_TEMPLATE_CACHE = collections.OrderedDict(
+)  # type: collections.OrderedDict[_TemplateKey, Tuple[ops.Operation, ...]]
+
+
+def _template_operations_on(template: Tuple[ops.Operation, ...],
+                            q0: 'cirq.Qid',
+                            q1: 'cirq.Qid') -> List[ops.Operation]:
+    qubit_map = {_TEMPLATE_QUBITS[0]: q0, _TEMPLATE_QUBITS[1]: q1}
+    return [op.transform_qubits(qubit_map.__getitem__) for op in template]
+
+
+def _two_qubit_matrix_to_operations(q0: 'cirq.Qid', q1: 'cirq.Qid',
+                                    mat: np.ndarray, allow_partial_czs: bool,
+                                    atol: float, clean_operations: bool
+                                   ) -> List[ops.Operation]:
     kak = linalg.kak_decomposition(mat, atol=atol)
     operations = _kak_decomposition_to_operations(
         q0, q1, kak, allow_partial_czs, atol=atol)
@@ -62,7 +111,7 @@ def two_qubit_matrix_to_operations(
 
 
 def _xx_interaction_via_full_czs(q0: 'cirq.Qid', q1: 'cirq.Qid', x: float):
-    a = x * -2 / np.pi
+    a = x * _EXPONENT_PER_RADIAN
     yield ops.H(q1)
     yield ops.CZ(q0, q1)
     yield ops.X(q0)**a
@@ -72,8 +121,8 @@ def _xx_interaction_via_full_czs(q0: 'cirq.Qid', q1: 'cirq.Qid', x: float):
 
 def _xx_yy_interaction_via_full_czs(q0: 'cirq.Qid', q1: 'cirq.Qid', x: float,
                                     y: float):
-    a = x * -2 / np.pi
-    b = y * -2 / np.pi
+    a = x * _EXPONENT_PER_RADIAN
+    b = y * _EXPONENT_PER_RADIAN
     yield ops.X(q0)**0.5
     yield ops.H(q1)
     yield ops.CZ(q0, q1)
@@ -88,9 +137,9 @@ def _xx_yy_interaction_via_full_czs(q0: 'cirq.Qid', q1: 'cirq.Qid', x: float,
 
 def _xx_yy_zz_interaction_via_full_czs(q0: 'cirq.Qid', q1: 'cirq.Qid', x: float,
                                        y: float, z: float):
-    a = x * -2 / np.pi + 0.5
-    b = y * -2 / np.pi + 0.5
-    c = z * -2 / np.pi + 0.5
+    a = x * _EXPONENT_PER_RADIAN + 0.5
+    b = y * _EXPONENT_PER_RADIAN + 0.5
+    c = z * _EXPONENT_PER_RADIAN + 0.5
     yield ops.X(q0)**0.5
     yield ops.H(q1)
     yield ops.CZ(q0, q1)
@@ -124,19 +173,18 @@ def _kak_decomposition_to_operations(q0: 'cirq.Qid',
                                      atol: float = 1e-8) -> List[ops.Operation]:
     """Assumes that the decomposition is canonical."""
     b0, b1 = kak.single_qubit_operations_before
-    pre = [_do_single_on(b0, q0, atol=atol), _do_single_on(b1, q1, atol=atol)]
     a0, a1 = kak.single_qubit_operations_after
-    post = [_do_single_on(a0, q0, atol=atol), _do_single_on(a1, q1, atol=atol)]
-
-    return list(cast(Iterable[ops.Operation], ops.flatten_op_tree([
-        pre,
-        _non_local_part(q0,
-                        q1,
-                        kak.interaction_coefficients,
-                        allow_partial_czs,
-                        atol=atol),
-        post,
-    ])))
+    return [
+        *_do_single_on(b0, q0, atol=atol),
+        *_do_single_on(b1, q1, atol=atol),
+        *_non_local_part(q0,
+                         q1,
+                         kak.interaction_coefficients,
+                         allow_partial_czs,
+                         atol=atol),
+        *_do_single_on(a0, q0, atol=atol),
+        *_do_single_on(a1, q1, atol=atol),
+    ]
 
 
 def _is_trivial_angle(rad: float, atol: float) -> bool:
@@ -153,55 +201,103 @@ def _parity_interaction(q0: 'cirq.Qid',
                         q1: 'cirq.Qid',
                         rads: float,
                         atol: float,
-                        gate: Optional[ops.Gate] = None):
-    """Yields a ZZ interaction framed by the given operation."""
+                        gate: Optional[ops.Gate] = None
+                       ) -> List[ops.Operation]:
+    """Returns a ZZ interaction framed by the given operation."""
     if abs(rads) < atol:
-        return
+        return []
 
-    h = rads * -2 / np.pi
+    h = rads * _EXPONENT_PER_RADIAN
+    result = []  # type: List[ops.Operation]
     if gate is not None:
         g = cast(ops.Gate, gate)
-        yield g.on(q0), g.on(q1)
+        result.append(g.on(q0))
+        result.append(g.on(q1))
 
     # If rads is ±pi/4 radians within tolerance, single full-CZ suffices.
     if _is_trivial_angle(rads, atol):
-        yield ops.CZ.on(q0, q1)
+        result.append(ops.CZ.on(q0, q1))
     else:
-        yield ops.CZ(q0, q1) ** (-2 * h)
+        result.append(ops.CZPowGate(exponent=-2 * h).on(q0, q1))
 
-    yield ops.Z(q0)**h
-    yield ops.Z(q1)**h
+    z = ops.ZPowGate(exponent=h)
+    result.append(z.on(q0))
+    result.append(z.on(q1))
     if gate is not None:
         g = protocols.inverse(gate)
-        yield g.on(q0), g.on(q1)
+        result.append(g.on(q0))
+        result.append(g.on(q1))
+    return result
 
 
-def _do_single_on(u: np.ndarray, q: 'cirq.Qid', atol: float = 1e-8):
-    for gate in decompositions.single_qubit_matrix_to_gates(u, atol):
-        yield gate(q)
+def _do_single_on(u: np.ndarray, q: 'cirq.Qid',
+                  atol: float = 1e-8) -> List[ops.Operation]:
+    return [
+        gate(q) for gate in decompositions.single_qubit_matrix_to_gates(u, atol)
+    ]
 
 
 def _non_local_part(q0: 'cirq.Qid',
                     q1: 'cirq.Qid',
                     interaction_coefficients: Tuple[float, float, float],
                     allow_partial_czs: bool,
-                    atol: float = 1e-8):
-    """Yields non-local operation of KAK decomposition."""
+                    atol: float = 1e-8) -> List[ops.Operation]:
+    """Returns the non-local operations of a KAK decomposition."""
+
+    special_case = _special_case_operations(q0, q1, interaction_coefficients,
+                                            atol)
+    if special_case is not None:
+        return special_case
 
     x, y, z = interaction_coefficients
 
     if (allow_partial_czs or
         all(_is_trivial_angle(e, atol) for e in [x, y, z])):
-        return [
-            _parity_interaction(q0, q1, x, atol, ops.Y**-0.5),
-            _parity_interaction(q0, q1, y, atol, ops.X**0.5),
-            _parity_interaction(q0, q1, z, atol)
-        ]
+        return _parity_interactions(q0, q1, x, y, z, atol)
 
     if abs(z) >= atol:
-        return _xx_yy_zz_interaction_via_full_czs(q0, q1, x, y, z)
+        return list(_xx_yy_zz_interaction_via_full_czs(q0, q1, x, y, z))
 
     if y >= atol:
-        return _xx_yy_interaction_via_full_czs(q0, q1, x, y)
+        return list(_xx_yy_interaction_via_full_czs(q0, q1, x, y))
+
+    return list(_xx_interaction_via_full_czs(q0, q1, x))
+
 
-    return _xx_interaction_via_full_czs(q0, q1, x)
+def _parity_interactions(q0: 'cirq.Qid', q1: 'cirq.Qid', x: float, y: float,
+                         z: float, atol: float) -> List[ops.Operation]:
+    return [
+        *_parity_interaction(q0, q1, x, atol, ops.Y**-0.5),
+        *_parity_interaction(q0, q1, y, atol, ops.X**0.5),
+        *_parity_interaction(q0, q1, z, atol),
+    ]
+
+
+def _special_case_operations(
+        q0: 'cirq.Qid', q1: 'cirq.Qid',
+        interaction_coefficients: Tuple[float, float, float],
+        atol: float) -> Optional[List[ops.Operation]]:
+    """Returns the precomputed non-local operations for common KAK vectors.
+
+    Returns None if the interaction coefficients aren't (within tolerance) one
+    of the vectors in `_KAK_SPECIAL_CASES`.
+    """
+    key = tuple(int(round(e / (np.pi / 4))) for e in interaction_coefficients)
+    if any(abs(e - k * np.pi / 4) >= atol
+           for e, k in zip(interaction_coefficients, key)):
+        return None
+    template = _KAK_SPECIAL_CASES.get(cast(Tuple[int, int, int], key))
+    if template is None:
+        return None
+    return _template_operations_on(template, q0, q1)
+
+
+# The non-local operations of the identity, CNOT, iSWAP and SWAP classes, on
+# placeholder qubits. Keyed by interaction coefficients in units of pi/4.
+_KAK_SPECIAL_CASES = {
+    key: tuple(
+        _parity_interactions(*_TEMPLATE_QUBITS,
+                             *(k * np.pi / 4 for k in key),
+                             atol=1e-8))
+    for key in [(0, 0, 0), (1, 0, 0), (1, 1, 0), (1, 1, 1), (1, 1, -1)]
+}  # type: Dict[Tuple[int, int, int], Tuple[ops.Operation, ...]]
@@ -14,6 +14,7 @@
 
 import cmath
 import random
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -21,7 +22,8 @@ import pytest
 import cirq
 from cirq import value
 from cirq.optimizers.two_qubit_decompositions import (
-    _parity_interaction, _is_trivial_angle
+    _parity_interaction, _parity_interactions, _is_trivial_angle,
+    _special_case_operations, _two_qubit_matrix_to_operations
 )
 
 
@@ -184,6 +186,48 @@ def test_two_to_ops_equivalent_and_bounded_for_known_and_random(
     assert_cz_depth_below(operations_with_full, max_full_cz_depth, True)
 
 
+def test_two_to_ops_reuses_decomposition_on_other_qubits():
+    a, b, c, d = cirq.LineQubit.range(4)
+    u = cirq.testing.random_unitary(4)
+
+    with mock.patch.object(cirq.linalg,
+                           'kak_decomposition',
+                           wraps=cirq.linalg.kak_decomposition) as kak:
+        operations_ab = cirq.two_qubit_matrix_to_operations(a, b, u, False)
+        operations_dc = cirq.two_qubit_matrix_to_operations(d, c, u, False)
+    assert kak.call_count == 1
+
+    assert operations_dc == [
+        op.transform_qubits({a: d, b: c}.__getitem__) for op in operations_ab
+    ]
+    assert_ops_implement_unitary(d, c, operations_dc, u)
+
+
+def test_two_to_ops_cache_miss_decomposes_unrounded_matrix():
+    a, b = cirq.LineQubit.range(2)
+    before, after = (cirq.kron(cirq.testing.random_unitary(2),
+                               cirq.testing.random_unitary(2))
+                     for _ in range(2))
+    u = after @ cirq.unitary(cirq.CNOT) @ before
+
+    operations = cirq.two_qubit_matrix_to_operations(a,
+                                                     b,
+                                                     u,
+                                                     False,
+                                                     clean_operations=False)
+    assert operations == _two_qubit_matrix_to_operations(
+        a, b, u, False, 1e-8, False)
+
+
+def test_two_to_ops_tight_tolerance():
+    a, b = cirq.LineQubit.range(2)
+    for _ in range(10):
+        u = cirq.testing.random_unitary(4)
+        operations = cirq.two_qubit_matrix_to_operations(a, b, u, False,
+                                                         atol=1e-12)
+        assert_ops_implement_unitary(a, b, operations, u, atol=1e-8)
+
+
 def test_trivial_parity_interaction_corner_case():
     q0 = cirq.NamedQubit('q0')
     q1 = cirq.NamedQubit('q1')
@@ -193,6 +237,26 @@ def test_trivial_parity_interaction_corner_case():
     assert len(circuit) == 2
 
 
+@pytest.mark.parametrize('key', [(0, 0, 0), (1, 0, 0), (1, 1, 0), (1, 1, 1),
+                                 (1, 1, -1)])
+def test_special_case_operations_match_parity_interactions(key):
+    a, b = cirq.LineQubit.range(2)
+    x, y, z = (k * np.pi / 4 + 1e-10 for k in key)
+
+    operations = _special_case_operations(a, b, (x, y, z), 1e-8)
+
+    assert operations == _parity_interactions(
+        a, b, *(k * np.pi / 4 for k in key), 1e-8)
+    kak = cirq.KakDecomposition(interaction_coefficients=(x, y, z))
+    assert_ops_implement_unitary(a, b, operations, cirq.unitary(kak))
+
+
+def test_special_case_operations_misses():
+    a, b = cirq.LineQubit.range(2)
+    assert _special_case_operations(a, b, (np.pi / 4, 0.1, 0), 1e-8) is None
+    assert _special_case_operations(a, b, (np.pi / 2, 0, 0), 1e-8) is None
+
+
 def test_kak_decomposition_depth_full_cz():
     a, b = cirq.LineQubit.range(2)
 